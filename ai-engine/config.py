@@ -3,13 +3,19 @@ Application configuration using Pydantic Settings.
 Loads configuration from environment variables with validation.
 """
 
-from typing import List
-from pydantic_settings import BaseSettings
-from pydantic import Field, validator
+import os
+from functools import lru_cache
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Optional, Tuple
+from pydantic_settings import BaseSettings, NoDecode
+from pydantic import BeforeValidator, Field
 from dotenv import load_dotenv
 
 
-load_dotenv()
+def _split_csv(value: Any) -> Any:
+    """Split a comma-separated string into a list of stripped items."""
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",")]
+    return value
 
 
 class Settings(BaseSettings):
@@ -18,21 +24,45 @@ class Settings(BaseSettings):
     # Service Configuration
     service_name: str = Field(default="ai-engine", env="SERVICE_NAME")
     service_version: str = Field(default="1.0.0", env="SERVICE_VERSION")
-    environment: str = Field(default="development", env="ENVIRONMENT")
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    environment: Annotated[
+        Literal["development", "staging", "production"],
+        BeforeValidator(str.lower)
+    ] = Field(default="development", env="ENVIRONMENT")
+    log_level: Annotated[
+        Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        BeforeValidator(str.upper)
+    ] = Field(default="INFO", env="LOG_LEVEL")
     
     # API Configuration
     api_v1_prefix: str = Field(default="/api/v1", env="API_V1_PREFIX")
-    cors_origins: str = Field(default="http://localhost:3000", env="CORS_ORIGINS")
+    # Defaults to the CPU count; provider limits and in-memory caches are per worker
+    workers: Optional[int] = Field(default=None, ge=1, env="WORKERS")
+    cors_origins: Annotated[List[str], NoDecode, BeforeValidator(_split_csv)] = Field(
+        default=["http://localhost:3000"], env="CORS_ORIGINS"
+    )
     
     # AI Provider Configuration
-    ai_provider: str = Field(default="gemini", env="AI_PROVIDER")
-    ai_temperature: float = Field(default=0.2, env="AI_TEMPERATURE")
-    ai_max_tokens: int = Field(default=4000, env="AI_MAX_TOKENS")
+    ai_provider: Annotated[
+        Literal["gemini", "openai", "claude"],
+        BeforeValidator(str.lower)
+    ] = Field(default="gemini", env="AI_PROVIDER")
+    ai_temperature: float = Field(default=0.2, ge=0.0, le=1.0, env="AI_TEMPERATURE")
+    ai_max_tokens: int = Field(default=4000, gt=0, le=10000, env="AI_MAX_TOKENS")
+    # Per worker process: each worker has its own request semaphore, so the
+    # host-wide cap on concurrent provider calls is workers x this value
+    ai_max_parallel_requests: int = Field(default=8, gt=0, env="AI_MAX_PARALLEL_REQUESTS")
     
     # Redis Configuration
     redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
     
+    # LLM Response Cache (only used when AI_TEMPERATURE is 0)
+    llm_cache_backend: Annotated[
+        Literal["memory", "redis", "none"],
+        BeforeValidator(str.lower)
+    ] = Field(default="memory", env="LLM_CACHE_BACKEND")
+    llm_cache_ttl: int = Field(default=3600, gt=0, env="LLM_CACHE_TTL")
+    llm_cache_max_entries: int = Field(default=1024, gt=0, env="LLM_CACHE_MAX_ENTRIES")
+    
     # API Keys (optional - validated when provider is selected)
     gemini_api_key: str = Field(default="", env="GEMINI_API_KEY")
     openai_api_key: str = Field(default="", env="OPENAI_API_KEY")
@@ -50,60 +80,12 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = Field(default=60, env="RATE_LIMIT_PER_MINUTE")
     
-    @validator("ai_provider")
-    def validate_ai_provider(cls, v: str) -> str:
-        """Validate AI provider value."""
-        valid_providers = ["gemini", "openai", "claude"]
-        if v.lower() not in valid_providers:
-            raise ValueError(
-                f"Invalid AI_PROVIDER: {v}. Must be one of: {', '.join(valid_providers)}"
-            )
-        return v.lower()
-    
-    @validator("environment")
-    def validate_environment(cls, v: str) -> str:
-        """Validate environment value."""
-        valid_envs = ["development", "staging", "production"]
-        if v.lower() not in valid_envs:
-            raise ValueError(
-                f"Invalid ENVIRONMENT: {v}. Must be one of: {', '.join(valid_envs)}"
-            )
-        return v.lower()
-    
-    @validator("log_level")
-    def validate_log_level(cls, v: str) -> str:
-        """Validate log level."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(
-                f"Invalid LOG_LEVEL: {v}. Must be one of: {', '.join(valid_levels)}"
-            )
-        return v.upper()
-    
-    @validator("ai_temperature")
-    def validate_temperature(cls, v: float) -> float:
-        """Validate temperature range."""
-        if not 0.0 <= v <= 1.0:
-            raise ValueError("AI_TEMPERATURE must be between 0.0 and 1.0")
-        return v
-    
-    @validator("ai_max_tokens")
-    def validate_max_tokens(cls, v: int) -> int:
-        """Validate max tokens."""
-        if v <= 0:
-            raise ValueError("AI_MAX_TOKENS must be positive")
-        if v > 10000:
-            raise ValueError("AI_MAX_TOKENS cannot exceed 10000")
-        return v
-    
-    def get_cors_origins_list(self) -> List[str]:
-        """
-        Parse CORS origins into a list.
-        
-        Returns:
-            List of allowed origins
-        """
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    # Provider name -> (API key field, API key env var, model field)
+    PROVIDER_FIELDS: ClassVar[Dict[str, Tuple[str, str, str]]] = {
+        "gemini": ("gemini_api_key", "GEMINI_API_KEY", "gemini_model"),
+        "openai": ("openai_api_key", "OPENAI_API_KEY", "openai_model"),
+        "claude": ("anthropic_api_key", "ANTHROPIC_API_KEY", "claude_model"),
+    }
     
     def get_api_key_for_provider(self, provider: str) -> str:
         """
@@ -118,22 +100,14 @@ class Settings(BaseSettings):
         Raises:
             ValueError: If API key is not configured
         """
-        provider = provider.lower()
-        
-        if provider == "gemini":
-            if not self.gemini_api_key:
-                raise ValueError("GEMINI_API_KEY not configured")
-            return self.gemini_api_key
-        elif provider == "openai":
-            if not self.openai_api_key:
-                raise ValueError("OPENAI_API_KEY not configured")
-            return self.openai_api_key
-        elif provider == "claude":
-            if not self.anthropic_api_key:
-                raise ValueError("ANTHROPIC_API_KEY not configured")
-            return self.anthropic_api_key
-        else:
+        fields = self.PROVIDER_FIELDS.get(provider.lower())
+        if fields is None:
             raise ValueError(f"Unknown provider: {provider}")
+        
+        api_key = getattr(self, fields[0])
+        if not api_key:
+            raise ValueError(f"{fields[1]} not configured")
+        return api_key
     
     def get_model_for_provider(self, provider: str) -> str:
         """
@@ -145,16 +119,10 @@ class Settings(BaseSettings):
         Returns:
             Model name string
         """
-        provider = provider.lower()
-        
-        if provider == "gemini":
-            return self.gemini_model
-        elif provider == "openai":
-            return self.openai_model
-        elif provider == "claude":
-            return self.claude_model
-        else:
+        fields = self.PROVIDER_FIELDS.get(provider.lower())
+        if fields is None:
             raise ValueError(f"Unknown provider: {provider}")
+        return getattr(self, fields[2])
     
     class Config:
         """Pydantic config."""
@@ -163,5 +131,20 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings (singleton).
+    
+    Settings, including the .env file, are loaded on first call
+    rather than at import time. In production the environment is
+    injected by the orchestrator, so the .env file is not read.
+    
+    Returns:
+        Cached Settings instance
+    """
+    if os.getenv("ENVIRONMENT", "development").lower() == "production":
+        return Settings(_env_file=None)
+    
+    load_dotenv()
+    return Settings()
@@ -0,0 +1,19 @@
+"""
+Shared wall-clock helpers.
+Timestamps on responses only need second precision, so they are formatted once per second.
+"""
+
+import time
+from datetime import datetime, timezone
+
+# (epoch second, ISO 8601 string) of the last formatted timestamp
+_timestamp_cache = (0, "")
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as ISO 8601, formatted at most once per second."""
+    global _timestamp_cache
+    now = int(time.time())
+    if now != _timestamp_cache[0]:
+        _timestamp_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+    return _timestamp_cache[1]
@@ -3,15 +3,13 @@ Factory for creating AI provider instances.
 Implements the Factory pattern for vendor-agnostic AI operations.
 """
 
-import os
 import logging
-from typing import Optional
+from importlib import import_module
+from typing import Optional, Type
 from enum import Enum
 
+from config import Settings, get_settings
 from providers.base import AIProviderBase
-from providers.gemini import GeminiProvider
-from providers.openai import OpenAIProvider
-from providers.claude import ClaudeProvider
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +21,27 @@ class AIProviderType(str, Enum):
     CLAUDE = "claude"
 
 
+_PROVIDER_VALUES = tuple(p.value for p in AIProviderType)
+_PROVIDER_VALUES_JOINED = ", ".join(_PROVIDER_VALUES)
+
+
 class AIProviderFactory:
     """
     Factory class for creating AI provider instances.
     Handles provider selection based on environment configuration.
     """
     
-    # Default model configurations for each provider
-    DEFAULT_MODELS = {
-        AIProviderType.GEMINI: "models/gemini-2.5-flash",
-        AIProviderType.OPENAI: "gpt-4-turbo-preview",
-        AIProviderType.CLAUDE: "claude-3-sonnet-20240229"
+    # Provider name -> enum member, for exception-free validation
+    _PROVIDER_MAP = {p.value: p for p in AIProviderType}
+    
+    # Provider type -> (module, class name). Imported on first use so only
+    # the SDK of the selected provider is loaded.
+    _PROVIDER_CLASSES = {
+        AIProviderType.GEMINI: ("providers.gemini", "GeminiProvider"),
+        AIProviderType.OPENAI: ("providers.openai", "OpenAIProvider"),
+        AIProviderType.CLAUDE: ("providers.claude", "ClaudeProvider")
     }
+    _loaded_classes = {}
     
     @staticmethod
     def create_provider(
@@ -42,19 +49,25 @@ class AIProviderFactory:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         temperature: Optional[float] = None,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        max_parallel_requests: Optional[int] = None,
+        settings: Optional[Settings] = None
     ) -> AIProviderBase:
         """
         Create an AI provider instance based on configuration.
         
         Args:
             provider_type: Type of provider (gemini, openai, claude).
-                          If None, uses AI_PROVIDER env var
+                          If None, uses settings.ai_provider
             api_key: API key for the provider.
-                    If None, uses provider-specific env var
-            model: Model name. If None, uses provider-specific env var or default
-            temperature: Sampling temperature. If None, uses AI_TEMPERATURE env var
-            max_tokens: Max output tokens. If None, uses AI_MAX_TOKENS env var
+                    If None, uses the provider-specific key from settings
+            model: Model name. If None, uses the provider-specific model from settings
+            temperature: Sampling temperature. If None, uses settings.ai_temperature
+            max_tokens: Max output tokens. If None, uses settings.ai_max_tokens
+            max_parallel_requests: Max concurrent API calls.
+                                  If None, uses settings.ai_max_parallel_requests
+            settings: Settings instance to read defaults from.
+                     If None, uses get_settings()
             
         Returns:
             Configured AI provider instance
@@ -73,117 +86,51 @@ class AIProviderFactory:
                 model="models/gemini-2.5-flash"
             )
         """
+        settings = settings or get_settings()
+        
         # Determine provider type
         if provider_type is None:
-            provider_type = os.getenv("AI_PROVIDER", "gemini").lower()
+            provider_type = settings.ai_provider
         else:
             provider_type = provider_type.lower()
         
         # Validate provider type
-        try:
-            provider_enum = AIProviderType(provider_type)
-        except ValueError:
-            valid_providers = [p.value for p in AIProviderType]
+        provider_enum = AIProviderFactory._PROVIDER_MAP.get(provider_type)
+        if provider_enum is None:
             raise ValueError(
                 f"Invalid AI provider: {provider_type}. "
-                f"Must be one of: {', '.join(valid_providers)}"
+                f"Must be one of: {_PROVIDER_VALUES_JOINED}"
             )
         
         # Get common configuration
-        temperature = temperature if temperature is not None else float(os.getenv("AI_TEMPERATURE", "0.2"))
-        max_tokens = max_tokens if max_tokens is not None else int(os.getenv("AI_MAX_TOKENS", "8192"))
+        temperature = temperature if temperature is not None else settings.ai_temperature
+        max_tokens = max_tokens if max_tokens is not None else settings.ai_max_tokens
+        if max_parallel_requests is None:
+            max_parallel_requests = settings.ai_max_parallel_requests
         
         # Create provider instance
-        if provider_enum == AIProviderType.GEMINI:
-            return AIProviderFactory._create_gemini_provider(
-                api_key, model, temperature, max_tokens
-            )
-        elif provider_enum == AIProviderType.OPENAI:
-            return AIProviderFactory._create_openai_provider(
-                api_key, model, temperature, max_tokens
-            )
-        elif provider_enum == AIProviderType.CLAUDE:
-            return AIProviderFactory._create_claude_provider(
-                api_key, model, temperature, max_tokens
-            )
-        else:
-            # This should never happen due to enum validation above
-            raise ValueError(f"Unsupported provider type: {provider_type}")
-    
-    @staticmethod
-    def _create_gemini_provider(
-        api_key: Optional[str],
-        model: Optional[str],
-        temperature: float,
-        max_tokens: int
-    ) -> GeminiProvider:
-        """Create Gemini provider instance."""
-        api_key = api_key or os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "Gemini API key not found. "
-                "Set GEMINI_API_KEY environment variable or pass api_key parameter"
-            )
+        provider_cls = AIProviderFactory._get_provider_class(provider_enum)
+        api_key = api_key or settings.get_api_key_for_provider(provider_enum.value)
+        model = model or settings.get_model_for_provider(provider_enum.value)
         
-        model = model or os.getenv("GEMINI_MODEL") or AIProviderFactory.DEFAULT_MODELS[AIProviderType.GEMINI]
-        
-        logger.info(f"Creating Gemini provider with model: {model}")
-        return GeminiProvider(
+        logger.info("Creating %s with model: %s", provider_cls.__name__, model)
+        return provider_cls(
             api_key=api_key,
             model=model,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            max_parallel_requests=max_parallel_requests
         )
     
     @staticmethod
-    def _create_openai_provider(
-        api_key: Optional[str],
-        model: Optional[str],
-        temperature: float,
-        max_tokens: int
-    ) -> OpenAIProvider:
-        """Create OpenAI provider instance."""
-        api_key = api_key or os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "OpenAI API key not found. "
-                "Set OPENAI_API_KEY environment variable or pass api_key parameter"
-            )
-        
-        model = model or os.getenv("OPENAI_MODEL") or AIProviderFactory.DEFAULT_MODELS[AIProviderType.OPENAI]
-        
-        logger.info(f"Creating OpenAI provider with model: {model}")
-        return OpenAIProvider(
-            api_key=api_key,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
-    
-    @staticmethod
-    def _create_claude_provider(
-        api_key: Optional[str],
-        model: Optional[str],
-        temperature: float,
-        max_tokens: int
-    ) -> ClaudeProvider:
-        """Create Claude provider instance."""
-        api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "Anthropic API key not found. "
-                "Set ANTHROPIC_API_KEY environment variable or pass api_key parameter"
-            )
-        
-        model = model or os.getenv("CLAUDE_MODEL") or AIProviderFactory.DEFAULT_MODELS[AIProviderType.CLAUDE]
-        
-        logger.info(f"Creating Claude provider with model: {model}")
-        return ClaudeProvider(
-            api_key=api_key,
-            model=model,
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+    def _get_provider_class(provider_enum: AIProviderType) -> Type[AIProviderBase]:
+        """Import (once) and return the implementation class for a provider."""
+        provider_cls = AIProviderFactory._loaded_classes.get(provider_enum)
+        if provider_cls is None:
+            module_name, class_name = AIProviderFactory._PROVIDER_CLASSES[provider_enum]
+            provider_cls = getattr(import_module(module_name), class_name)
+            AIProviderFactory._loaded_classes[provider_enum] = provider_cls
+        return provider_cls
     
     @staticmethod
     def get_available_providers() -> list[str]:
@@ -193,7 +140,7 @@ class AIProviderFactory:
         Returns:
             List of provider type strings
         """
-        return [p.value for p in AIProviderType]
+        return list(_PROVIDER_VALUES)
     
     @staticmethod
     def get_default_model(provider_type: str) -> str:
@@ -209,12 +156,12 @@ class AIProviderFactory:
         Raises:
             ValueError: If provider type is invalid
         """
-        try:
-            provider_enum = AIProviderType(provider_type.lower())
-            return AIProviderFactory.DEFAULT_MODELS[provider_enum]
-        except ValueError:
-            valid_providers = [p.value for p in AIProviderType]
+        provider_enum = AIProviderFactory._PROVIDER_MAP.get(provider_type.lower())
+        if provider_enum is None:
             raise ValueError(
                 f"Invalid provider type: {provider_type}. "
-                f"Must be one of: {', '.join(valid_providers)}"
+                f"Must be one of: {_PROVIDER_VALUES_JOINED}"
             )
+        # Defaults live solely in the Settings field definitions
+        model_field = Settings.PROVIDER_FIELDS[provider_enum.value][2]
+        return Settings.model_fields[model_field].default
@@ -0,0 +1,130 @@
+"""
+LLM response cache.
+Stores validated AI responses keyed on everything that determines the completion,
+so identical requests skip the provider round-trip.
+"""
+
+import time
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryLRU:
+    """Process-local LRU backend with per-entry expiry."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def aclose(self) -> None:
+        self._entries.clear()
+
+
+class RedisBackend:
+    """Redis backend shared across workers; values are stored as orjson bytes."""
+
+    KEY_PREFIX = "llm_cache:"
+
+    def __init__(self, redis_url: str):
+        self.redis = redis.from_url(redis_url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        try:
+            data = await self.redis.get(self.KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("LLM cache read failed: %s", e)
+            return None
+        return orjson.loads(data) if data is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        try:
+            await self.redis.setex(self.KEY_PREFIX + key, ttl, orjson.dumps(value))
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self.redis.aclose()
+
+
+class LLMCache:
+    """
+    Cache for LLM responses with hit/miss accounting.
+
+    Backend failures are logged and treated as misses, so the cache can never
+    fail a request.
+    """
+
+    def __init__(self, backend, ttl: int = 3600):
+        """
+        Args:
+            backend: Storage backend exposing async get(key), set(key, value, ttl) and aclose()
+            ttl: Default time-to-live in seconds
+        """
+        self.backend = backend
+        self.ttl = ttl
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def from_settings(cls, settings) -> Optional["LLMCache"]:
+        """
+        Build the cache selected by LLM_CACHE_BACKEND.
+
+        Returns:
+            Configured cache, or None when caching is disabled
+        """
+        if settings.llm_cache_backend == "redis":
+            backend = RedisBackend(settings.redis_url)
+        elif settings.llm_cache_backend == "memory":
+            backend = InMemoryLRU(maxsize=settings.llm_cache_max_entries)
+        else:
+            return None
+        return cls(backend, ttl=settings.llm_cache_ttl)
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+        """Hash every input that determines the completion into a cache key."""
+        payload = orjson.dumps(
+            {"m": model, "s": system_prompt, "u": user_prompt, "t": temperature},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self.backend.get(key)
+        if value is None:
+            self.stats["misses"] += 1
+        else:
+            self.stats["hits"] += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        await self.backend.set(key, value, ttl or self.ttl)
+
+    async def aclose(self) -> None:
+        """Release the backend's resources, e.g. its Redis connection pool."""
+        await self.backend.aclose()
@@ -4,12 +4,45 @@ Uses Chain of Thought reasoning and System Persona techniques.
 All prompts must return valid JSON matching our Pydantic schemas.
 """
 
-from typing import Dict
+from string import Formatter
+from types import MappingProxyType
+from typing import Mapping, Sequence, Tuple
+
+
+def _split_template(template: str, *fields: str) -> Tuple[str, ...]:
+    """
+    Pre-parse a str.format template into its literal chunks.
+    
+    Escaped braces are resolved once here, so rendering is a plain
+    concatenation of the chunks with the field values in between.
+    
+    Args:
+        template: Template using str.format placeholders
+        fields: Expected placeholder names, in order of appearance
+        
+    Returns:
+        Tuple of len(fields) + 1 literal chunks
+        
+    Raises:
+        ValueError: If the template placeholders don't match fields
+    """
+    chunks = [""]
+    found = []
+    for literal, field, _, _ in Formatter().parse(template):
+        chunks[-1] += literal
+        if field is not None:
+            found.append(field)
+            chunks.append("")
+    if tuple(found) != fields:
+        raise ValueError(f"Template fields {found} do not match {list(fields)}")
+    return tuple(chunks)
 
 
 class PromptTemplates:
     """Centralized prompt templates for AI operations."""
     
+    __slots__ = ()
+    
     SYSTEM_PERSONA = """You are an expert ATS (Applicant Tracking System) analyzer and career coach with 15+ years of experience in technical recruiting and resume optimization. You have deep knowledge of:
 - Modern ATS algorithms and keyword matching
 - Industry-specific requirements across tech roles
@@ -96,6 +129,11 @@ Perform a comprehensive ATS analysis using the following step-by-step approach:
 
 Return only the JSON object, nothing else."""
 
+    # Precomputed sizes for pre-flight token budgeting (~4 chars per token)
+    SYSTEM_PERSONA_LEN = len(SYSTEM_PERSONA)
+    SYSTEM_PERSONA_APPROX_TOKENS = SYSTEM_PERSONA_LEN >> 2
+    RESUME_PROMPT_STATIC_LEN = len(RESUME_ANALYSIS_PROMPT.format(resume_text="", target_role=""))
+
  # ===== NEW: Roadmap System Prompt =====
     ROADMAP_SYSTEM_PROMPT = """You are an expert learning path designer and career mentor. 
 Your role is to create personalized, actionable 8-week learning roadmaps for professionals 
@@ -166,16 +204,7 @@ Analyze the transcript and provide:
   "summary": "The candidate showed great potential..."
 }}"""
 
-    def get_roadmap_generation_prompt(
-        self,
-        missing_skills: list,
-        target_role: str
-    ) -> str:
-        """Generate prompt for roadmap creation"""
-        
-        skills_list = ", ".join(missing_skills)
-        
-        return f"""Create a personalized 8-week learning roadmap for someone targeting the role of "{target_role}".
+    ROADMAP_GENERATION_PROMPT = """Create a personalized 8-week learning roadmap for someone targeting the role of "{target_role}".
 
 Missing Skills to Learn: {skills_list}
 
@@ -224,6 +253,21 @@ Target Role: {target_role}
 
 Generate the roadmap now:"""
 
+    @staticmethod
+    def get_roadmap_generation_prompt(
+        missing_skills: Sequence[str],
+        target_role: str
+    ) -> str:
+        """Generate prompt for roadmap creation"""
+        
+        skills_list = ", ".join(missing_skills)
+        
+        return (
+            f"{_ROADMAP_PARTS[0]}{target_role}{_ROADMAP_PARTS[1]}{skills_list}"
+            f"{_ROADMAP_PARTS[2]}{skills_list}{_ROADMAP_PARTS[3]}{target_role}"
+            f"{_ROADMAP_PARTS[4]}"
+        )
+
     SKILL_GAP_ANALYSIS_PROMPT = """Analyze the skill gap for a candidate targeting the role of "{target_role}".
 
 **Current Skills (from resume):**
@@ -263,13 +307,46 @@ Return valid JSON with this structure:
         Returns:
             Formatted prompt string
         """
-        return PromptTemplates.RESUME_ANALYSIS_PROMPT.format(
-            resume_text=resume_text,
-            target_role=target_role
+        return (
+            f"{_RESUME_PARTS[0]}{target_role}{_RESUME_PARTS[1]}{resume_text}"
+            f"{_RESUME_PARTS[2]}{target_role}{_RESUME_PARTS[3]}{target_role}"
+            f"{_RESUME_PARTS[4]}"
         )
     
     @staticmethod
-    def get_system_messages(provider: str) -> Dict[str, str]:
+    def approx_tokens(text: str) -> int:
+        """
+        Estimate the token count of a text without tokenizing it.
+        
+        Args:
+            text: Prompt text
+            
+        Returns:
+            Approximate token count (~4 characters per token)
+        """
+        return len(text) >> 2
+    
+    @staticmethod
+    def estimate_resume_analysis_tokens(resume_text: str, target_role: str) -> int:
+        """
+        Estimate prompt tokens for a resume analysis before building the prompt.
+        
+        Args:
+            resume_text: Raw text from the resume
+            target_role: Target job role
+            
+        Returns:
+            Approximate token count of system persona plus user prompt
+        """
+        prompt_len = (
+            PromptTemplates.RESUME_PROMPT_STATIC_LEN
+            + len(resume_text)
+            + 3 * len(target_role)
+        )
+        return PromptTemplates.SYSTEM_PERSONA_APPROX_TOKENS + (prompt_len >> 2)
+    
+    @staticmethod
+    def get_system_messages(provider: str) -> Mapping[str, str]:
         """
         Get provider-specific system messages.
         
@@ -277,12 +354,10 @@ Return valid JSON with this structure:
             provider: AI provider name (gemini, openai, claude)
             
         Returns:
-            Dictionary with system message configuration
+            Read-only mapping with system message configuration,
+            shared between calls. Copy with dict() before modifying.
         """
-        return {
-            "role": "system",
-            "content": PromptTemplates.SYSTEM_PERSONA
-        }
+        return _SYSTEM_MESSAGE
     
     @staticmethod
     def get_skill_gap_prompt(current_skills: list, target_role: str) -> str:
@@ -297,9 +372,9 @@ Return valid JSON with this structure:
             Formatted prompt string
         """
         skills_text = ", ".join(current_skills) if current_skills else "None identified"
-        return PromptTemplates.SKILL_GAP_ANALYSIS_PROMPT.format(
-            current_skills=skills_text,
-            target_role=target_role
+        return (
+            f"{_SKILL_GAP_PARTS[0]}{target_role}{_SKILL_GAP_PARTS[1]}{skills_text}"
+            f"{_SKILL_GAP_PARTS[2]}{target_role}{_SKILL_GAP_PARTS[3]}"
         )
 
     @staticmethod
@@ -449,6 +524,25 @@ Return ONLY the JSON. No markdown, no extra text."""
         )
 
 
+_SYSTEM_MESSAGE = MappingProxyType({
+    "role": "system",
+    "content": PromptTemplates.SYSTEM_PERSONA
+})
+
+# Pre-split templates for the hot-path prompt builders
+_RESUME_PARTS = _split_template(
+    PromptTemplates.RESUME_ANALYSIS_PROMPT,
+    "target_role", "resume_text", "target_role", "target_role"
+)
+_SKILL_GAP_PARTS = _split_template(
+    PromptTemplates.SKILL_GAP_ANALYSIS_PROMPT,
+    "target_role", "current_skills", "target_role"
+)
+_ROADMAP_PARTS = _split_template(
+    PromptTemplates.ROADMAP_GENERATION_PROMPT,
+    "target_role", "skills_list", "skills_list", "target_role"
+)
+
 # JSON Schema for response validation (can be used with some providers)
 RESUME_ANALYSIS_JSON_SCHEMA = {
     "type": "object",
@@ -5,53 +5,116 @@ Provides singleton instances of services and providers.
 
 import logging
 import os
-from functools import lru_cache
+from typing import Dict
 
 from core.factory import AIProviderFactory
+from providers.base import AIProviderBase
 from services.ai_service import AIService
 from services.interview_service import InterviewService
 from services.interview_agent_service import InterviewAgentService
 from services.rag_service import RAGService
 from services.mentor_service import MentorService
-from config import settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Singleton instances, created on first use
+_ai_provider = None
+_standby_providers = None
+_ai_service = None
+_interview_service = None
+_rag_service = None
+_mentor_service = None
+
 
-@lru_cache()
 def get_ai_provider():
     """
     Get or create AI provider instance (singleton).
     """
-    logger.info(f"Creating AI provider: {settings.ai_provider}")
+    global _ai_provider
+    if _ai_provider is not None:
+        return _ai_provider
+    
+    settings = get_settings()
+    logger.info("Creating AI provider: %s", settings.ai_provider)
     
     try:
         provider = AIProviderFactory.create_provider(
             provider_type=settings.ai_provider,
             temperature=settings.ai_temperature,
-            max_tokens=settings.ai_max_tokens
+            max_tokens=settings.ai_max_tokens,
+            settings=settings
         )
-        logger.info(f"AI provider created successfully: {provider.get_provider_name()}")
+        logger.info("AI provider created successfully: %s", provider.get_provider_name())
+        _ai_provider = provider
         return provider
     except Exception as e:
-        logger.error(f"Failed to create AI provider: {str(e)}")
+        logger.error("Failed to create AI provider: %s", e)
         raise
 
 
-@lru_cache()
+def get_standby_providers() -> Dict[str, AIProviderBase]:
+    """
+    Get or create instances of the non-default providers that have an API key configured.
+    
+    Returns:
+        Mapping of provider name to provider instance
+    """
+    global _standby_providers
+    if _standby_providers is not None:
+        return _standby_providers
+    
+    settings = get_settings()
+    providers = {}
+    for name in AIProviderFactory.get_available_providers():
+        if name == settings.ai_provider:
+            continue
+        try:
+            providers[name] = AIProviderFactory.create_provider(
+                provider_type=name,
+                temperature=settings.ai_temperature,
+                max_tokens=settings.ai_max_tokens,
+                settings=settings
+            )
+        except Exception as e:
+            logger.info("Skipping standby provider %s: %s", name, e)
+    
+    _standby_providers = providers
+    return providers
+
+
+async def close_ai_provider() -> None:
+    """Release the network resources of every AI provider that was created, and of the response cache."""
+    if _ai_provider is not None:
+        await _ai_provider.aclose()
+    for provider in (_standby_providers or {}).values():
+        await provider.aclose()
+    if _ai_service is not None and _ai_service.cache is not None:
+        await _ai_service.cache.aclose()
+
+
 def get_ai_service() -> AIService:
     """Get or create AI service instance (singleton)."""
-    provider = get_ai_provider()
-    return AIService(provider=provider)
+    global _ai_service
+    if _ai_service is None:
+        _ai_service = AIService(provider=get_ai_provider())
+    return _ai_service
 
 
-@lru_cache()
 def get_interview_service():
     """Get or create Interview service instance (singleton).
     
     Uses LangChain Agent by default. Set USE_AGENT_INTERVIEW=false
     to fall back to the old prompt-based service.
     """
+    global _interview_service
+    if _interview_service is None:
+        _interview_service = _create_interview_service()
+    return _interview_service
+
+
+def _create_interview_service():
+    """Build the interview service selected by USE_AGENT_INTERVIEW."""
     use_agent = os.getenv("USE_AGENT_INTERVIEW", "true").lower() == "true"
     
     if use_agent:
@@ -60,7 +123,7 @@ def get_interview_service():
             logger.info("Using LangChain Interview Agent")
             return service
         except Exception as e:
-            logger.warning(f"Failed to init agent, falling back to legacy: {str(e)}")
+            logger.warning("Failed to init agent, falling back to legacy: %s", e)
             provider = get_ai_provider()
             return InterviewService(provider=provider)
     else:
@@ -69,22 +132,28 @@ def get_interview_service():
         return InterviewService(provider=provider)
 
 
-@lru_cache()
 def get_rag_service() -> RAGService:
     """Get or create RAG service instance (singleton)."""
-    provider = get_ai_provider()
-    return RAGService(provider=provider)
+    global _rag_service
+    if _rag_service is None:
+        _rag_service = RAGService(provider=get_ai_provider())
+    return _rag_service
 
 
-@lru_cache()
 def get_mentor_service() -> MentorService:
     """Get or create Mentor service instance (singleton)."""
-    provider = get_ai_provider()
-    rag_service = get_rag_service()
-    return MentorService(provider=provider, rag_service=rag_service)
+    global _mentor_service
+    if _mentor_service is None:
+        _mentor_service = MentorService(
+            provider=get_ai_provider(),
+            rag_service=get_rag_service()
+        )
+    return _mentor_service
 
 
 # FastAPI dependencies
+# Kept as `async def`: FastAPI awaits coroutine dependencies directly on the
+# event loop, while plain `def` dependencies are dispatched to the threadpool.
 async def get_ai_service_dependency() -> AIService:
     return get_ai_service()
 
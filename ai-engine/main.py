@@ -3,16 +3,25 @@ FastAPI application entry point.
 Main API with health check, resume analysis, mock interview, and mentor matching endpoints.
 """
 
+import os
+import sys
+import asyncio
 import logging
-from datetime import datetime, timezone
+import orjson
 from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 
-from config import settings
+from config import get_settings
+from core.factory import AIProviderFactory
+from core.clock import utc_timestamp
 from dependencies import (
+    close_ai_provider,
+    get_ai_service,
+    get_standby_providers,
     get_ai_service_dependency, 
     get_interview_service_dependency,
     get_mentor_service_dependency,
@@ -48,6 +57,8 @@ from providers.base import (
     AIProviderInvalidResponseError
 )
 
+settings = get_settings()
+
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
@@ -59,6 +70,75 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Static response bodies are fixed for the life of the process, so serialize them once
+_ROOT_BODY = orjson.dumps({
+    "service": settings.service_name,
+    "version": settings.service_version,
+    "environment": settings.environment,
+    "docs": f"{settings.api_v1_prefix}/docs",
+    "health": "/health"
+})
+
+# Everything but the trailing "}", so the live provider status can be appended
+_PROVIDERS_HEAD = orjson.dumps({
+    "current_provider": settings.ai_provider,
+    "available_providers": AIProviderFactory.get_available_providers(),
+    "provider_models": {
+        provider: settings.get_model_for_provider(provider)
+        for provider in AIProviderFactory.get_available_providers()
+    }
+})[:-1] + b',"provider_status":'
+
+# /health only varies in status, timestamp and provider status; the rest is spliced in as bytes
+_HEALTH_MIDDLE = (
+    b',"service":' + orjson.dumps(settings.service_name)
+    + b',"version":' + orjson.dumps(settings.service_version)
+    + b',"timestamp":'
+)
+_HEALTH_TAIL = b',"ai_provider":' + orjson.dumps(settings.ai_provider) + b',"ai_provider_status":'
+
+
+def _health_response(health_status: HealthStatus, timestamp: str, provider_status: str) -> Response:
+    """Build a HealthCheckResponse body from the pre-serialized static fields."""
+    return Response(
+        content=b"".join((
+            b'{"status":', orjson.dumps(health_status),
+            _HEALTH_MIDDLE, orjson.dumps(timestamp),
+            _HEALTH_TAIL, orjson.dumps(provider_status),
+            b"}"
+        )),
+        media_type="application/json"
+    )
+
+
+async def _prepend(first: str, rest: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Re-attach an already consumed first chunk to the rest of a stream."""
+    yield first
+    async for chunk in rest:
+        yield chunk
+
+
+async def _warm_and_check(provider) -> dict:
+    """Prime the primary provider's connection pool, then run its (cached) health check."""
+    try:
+        await provider.warmup()
+    except Exception as e:
+        logger.warning("%s warmup failed: %s", provider.get_provider_name(), e)
+    return await provider.get_health()
+
+
+async def _warm_standby(provider) -> dict:
+    """
+    Prime a standby provider's connection pool.
+    Only the cheap warmup request is made; standbys get no paid health-check generation.
+    """
+    try:
+        await provider.warmup()
+    except Exception as e:
+        logger.warning("%s warmup failed: %s", provider.get_provider_name(), e)
+        return {"status": "unreachable", "provider": provider.get_provider_name(), "error": str(e)}
+    return {"status": "warm", "provider": provider.get_provider_name()}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -66,22 +146,30 @@ async def lifespan(app: FastAPI):
     Application lifespan manager.
     Handles startup and shutdown events.
     """
-    logger.info(f"Starting {settings.service_name} v{settings.service_version}")
-    logger.info(f"Environment: {settings.environment}")
-    logger.info(f"AI Provider: {settings.ai_provider}")
+    logger.info("Starting %s v%s", settings.service_name, settings.service_version)
+    logger.info("Environment: %s", settings.environment)
+    logger.info("AI Provider: %s", settings.ai_provider)
     
-    # Test AI provider connection
+    # Check the primary provider and warm the standbys concurrently
     try:
-        from dependencies import get_ai_service
-        ai_service = get_ai_service()
-        health = await ai_service.health_check()
-        logger.info(f"AI Provider health check: {health}")
+        standbys = get_standby_providers()
+        results = await asyncio.gather(
+            _warm_and_check(get_ai_service().provider),
+            *(_warm_standby(provider) for provider in standbys.values()),
+            return_exceptions=True
+        )
+        for name, health in zip((settings.ai_provider, *standbys), results):
+            if isinstance(health, Exception):
+                health = {"status": "unhealthy", "provider": name, "error": str(health)}
+            app.state.provider_status[name] = health
+            logger.info("AI Provider %s health check: %s", name, health)
     except Exception as e:
-        logger.error(f"Failed to initialize AI provider: {str(e)}")
+        logger.error("Failed to initialize AI provider: %s", e)
         logger.warning("Service starting with degraded AI capabilities")
     
     yield
-    logger.info(f"Shutting down {settings.service_name}")
+    logger.info("Shutting down %s", settings.service_name)
+    await close_ai_provider()
 
 
 # Create FastAPI app
@@ -90,15 +178,19 @@ app = FastAPI(
     description="Production-grade AI microservice for career development, mock interviews, and mentor matching",
     version=settings.service_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url=f"{settings.api_v1_prefix}/docs",
     redoc_url=f"{settings.api_v1_prefix}/redoc",
     openapi_url=f"{settings.api_v1_prefix}/openapi.json"
 )
 
+# Latest health result per provider, filled at startup and refreshed by /health
+app.state.provider_status = {}
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.get_cors_origins_list(),
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -106,26 +198,45 @@ app.add_middleware(
 
 
 # Exception handlers
-@app.exception_handler(AIProviderAuthError)
-async def ai_auth_error_handler(request, exc: AIProviderAuthError):
-    logger.error(f"AI authentication error: {exc.message}")
-    return JSONResponse(
-        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-        content={
-            "error": "AIAuthenticationError",
-            "message": "AI service authentication failed.",
-            "detail": {"provider": exc.provider}
-        }
+# Maps each provider error type to (HTTP status, error name, client-facing message)
+_ERR_TABLE = {
+    AIProviderError: (
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        "AIProviderError",
+        "An error occurred while processing your request."
+    ),
+    AIProviderAuthError: (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "AIAuthenticationError",
+        "AI service authentication failed."
+    ),
+    AIProviderConnectionError: (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "AIConnectionError",
+        "AI service is currently unreachable."
+    ),
+    AIProviderRateLimitError: (
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        "AIRateLimitError",
+        "AI service rate limit exceeded. Please retry later."
+    ),
+    AIProviderInvalidResponseError: (
+        status.HTTP_502_BAD_GATEWAY,
+        "AIInvalidResponseError",
+        "AI service returned an invalid response."
     )
+}
+
 
 @app.exception_handler(AIProviderError)
 async def ai_provider_error_handler(request, exc: AIProviderError):
-    logger.error(f"AI provider error: {exc.message}")
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    status_code, error_name, message = _ERR_TABLE.get(type(exc), _ERR_TABLE[AIProviderError])
+    logger.error("%s: %s", error_name, exc.message)
+    return ORJSONResponse(
+        status_code=status_code,
         content={
-            "error": "AIProviderError",
-            "message": "An error occurred while processing your request.",
+            "error": error_name,
+            "message": message,
             "detail": {"provider": exc.provider}
         }
     )
@@ -135,44 +246,48 @@ async def ai_provider_error_handler(request, exc: AIProviderError):
 @app.get("/", tags=["Root"])
 async def root():
     """Root endpoint with service information."""
-    return {
-        "service": settings.service_name,
-        "version": settings.service_version,
-        "environment": settings.environment,
-        "docs": f"{settings.api_v1_prefix}/docs",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+
+@app.get("/providers", tags=["Health"])
+async def list_providers(request: Request):
+    """
+    List the configured AI provider, the configured model of each supported provider,
+    and the last known status of each provider instantiated by this worker.
+    """
+    return Response(
+        content=_PROVIDERS_HEAD + orjson.dumps(request.app.state.provider_status) + b"}",
+        media_type="application/json"
+    )
 
 
 @app.get("/health", response_model=HealthCheckResponse, tags=["Health"])
 async def health_check(
+    request: Request,
+    force: bool = False,
     ai_service: AIService = Depends(get_ai_service_dependency)
 ):
     """
     Health check endpoint.
     Verifies service and AI provider connectivity.
+    A successful provider check is cached briefly; pass ?force=true to bypass it.
     """
     try:
-        service_health = await ai_service.health_check()
+        service_health = await ai_service.health_check(force=force)
+        request.app.state.provider_status[settings.ai_provider] = service_health.get("provider", {})
         status_code = HealthStatus.HEALTHY if service_health.get("status") == "healthy" else HealthStatus.UNHEALTHY
         
-        return HealthCheckResponse(
-            status=status_code,
-            service=settings.service_name,
-            version=settings.service_version,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            ai_provider=settings.ai_provider,
-            ai_provider_status=service_health.get("provider", {}).get("status", "unknown")
+        return _health_response(
+            status_code,
+            utc_timestamp(),
+            service_health.get("provider", {}).get("status", "unknown")
         )
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
-        return HealthCheckResponse(
-            status=HealthStatus.UNHEALTHY,
-            service=settings.service_name,
-            version=settings.service_version,
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            ai_provider=settings.ai_provider,
-            ai_provider_status="error"
+        logger.error("Health check failed: %s", e)
+        return _health_response(
+            HealthStatus.UNHEALTHY,
+            utc_timestamp(),
+            "error"
         )
 
 
@@ -187,21 +302,47 @@ async def health_check(
 async def analyze_resume(
     request: ResumeAnalysisRequest,
     ai_service: AIService = Depends(get_ai_service_dependency)
-) -> ResumeAnalysisResponse:
+) -> Response:
     """Analyze a resume for ATS compatibility and skill gaps."""
     try:
-        logger.info(f"Received resume analysis request for role: {request.target_role}")
-        result = await ai_service.analyze_resume(request)
+        logger.info("Received resume analysis request for role: %s", request.target_role)
+        # Already validated by the service; send the bytes without re-encoding
+        body = await ai_service.analyze_resume_bytes(request)
         logger.info("Resume analysis completed successfully")
-        return result
+        return Response(content=body, media_type="application/json")
+    except AIProviderError:
+        # Mapped to a status code by ai_provider_error_handler
+        raise
     except Exception as e:
-        logger.error(f"Unexpected error in analyze_resume: {str(e)}")
+        logger.error("Unexpected error in analyze_resume: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail={"error": "InternalServerError", "message": str(e)}
         )
 
 
+@app.post(
+    f"{settings.api_v1_prefix}/analyze-resume/stream",
+    tags=["Resume Analysis"],
+    summary="Stream Resume Analysis",
+    description="Stream the raw analysis JSON as it is generated; the body is unvalidated and carries no metadata"
+)
+async def analyze_resume_stream(
+    request: ResumeAnalysisRequest,
+    ai_service: AIService = Depends(get_ai_service_dependency)
+):
+    """Stream a resume analysis for clients that render partial results."""
+    logger.info("Streaming resume analysis for role: %s", request.target_role)
+    stream = ai_service.analyze_resume_stream(request)
+    # Wait for the first chunk before sending headers, so provider errors still
+    # reach ai_provider_error_handler instead of ending a 200 response early
+    try:
+        first = await stream.__anext__()
+    except StopAsyncIteration:
+        first = ""
+    return StreamingResponse(_prepend(first, stream), media_type="application/json")
+
+
 @app.post(
     f"{settings.api_v1_prefix}/generate-roadmap",
     response_model=RoadmapResponse,
@@ -216,14 +357,17 @@ async def generate_roadmap(
 ):
     """Generate personalized 8-week learning roadmap."""
     try:
-        logger.info(f"Generating roadmap for role: {request.target_role}")
+        logger.info("Generating roadmap for role: %s", request.target_role)
         roadmap = await ai_service.generate_roadmap(
             missing_skills=request.missing_skills,
             target_role=request.target_role
         )
         return roadmap
+    except AIProviderError:
+        # Mapped to a status code by ai_provider_error_handler
+        raise
     except Exception as e:
-        logger.error(f"Roadmap generation failed: {str(e)}")
+        logger.error("Roadmap generation failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -240,10 +384,13 @@ async def start_interview(
 ):
     """Start a new AI-led interview simulation."""
     try:
-        logger.info(f"Starting interview session for role: {request.target_role}")
+        logger.info("Starting interview session for role: %s", request.target_role)
         return await interview_service.start_interview(request)
+    except AIProviderError:
+        # Mapped to a status code by ai_provider_error_handler
+        raise
     except Exception as e:
-        logger.error(f"Failed to start interview: {str(e)}")
+        logger.error("Failed to start interview: %s", e)
         raise HTTPException(status_code=500, detail="Failed to initialize interview")
 
 
@@ -261,8 +408,11 @@ async def interview_chat(
     """Exchange messages with the AI interviewer."""
     try:
         return await interview_service.process_chat(request)
+    except AIProviderError:
+        # Mapped to a status code by ai_provider_error_handler
+        raise
     except Exception as e:
-        logger.error(f"Interview chat error: {str(e)}")
+        logger.error("Interview chat error: %s", e)
         raise HTTPException(status_code=500, detail="Error processing interview response")
 
 
@@ -279,10 +429,13 @@ async def end_interview(
 ):
     """End the interview and get structured feedback."""
     try:
-        logger.info(f"Ending interview session: {session_id}")
+        logger.info("Ending interview session: %s", session_id)
         return await interview_service.generate_report(session_id)
+    except AIProviderError:
+        # Mapped to a status code by ai_provider_error_handler
+        raise
     except Exception as e:
-        logger.error(f"Failed to generate interview report: {str(e)}")
+        logger.error("Failed to generate interview report: %s", e)
         raise HTTPException(status_code=500, detail="Error generating final report")
 
 
@@ -299,10 +452,13 @@ async def match_mentors(
 ):
     """Calculate semantic similarity between student profile and mentor database."""
     try:
-        logger.info(f"Finding mentor matches for target role: {request.target_role}")
+        logger.info("Finding mentor matches for target role: %s", request.target_role)
         return await mentor_service.match_mentors(request)
+    except AIProviderError:
+        # Mapped to a status code by ai_provider_error_handler
+        raise
     except Exception as e:
-        logger.error(f"Mentor matching error: {str(e)}")
+        logger.error("Mentor matching error: %s", e)
         raise HTTPException(status_code=500, detail="Error finding mentor matches")
 
 
@@ -320,17 +476,25 @@ async def index_mentor(
     try:
         await rag_service.index_mentor(request.mentor_id, request.profile_text, request.metadata)
         return {"status": "success", "mentor_id": request.mentor_id}
+    except AIProviderError:
+        # Mapped to a status code by ai_provider_error_handler
+        raise
     except Exception as e:
-        logger.error(f"Indexing error: {str(e)}")
+        logger.error("Indexing error: %s", e)
         raise HTTPException(status_code=500, detail="Failed to index mentor profile")
 
 
 if __name__ == "__main__":
     import uvicorn
+    reload = settings.environment == "development"
+    # uvloop and httptools come with uvicorn[standard] but have no Windows builds
+    fast_io = {"loop": "uvloop", "http": "httptools"} if sys.platform != "win32" else {}
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.environment == "development",
-        log_level=settings.log_level.lower()
+        reload=reload,
+        log_level=settings.log_level.lower(),
+        workers=1 if reload else (settings.workers or os.cpu_count() or 1),
+        **fast_io
     )
\ No newline at end of file
@@ -1,6 +1,21 @@
+from importlib import import_module
+
 from .base import AIProviderBase
-from .gemini import GeminiProvider
-from .claude import ClaudeProvider
-from .openai import OpenAIProvider
 
-__all__ = ["AIProviderBase", "GeminiProvider", "ClaudeProvider", "OpenAIProvider"]
+# Provider classes are imported on first access so that only the SDK of
+# the provider actually in use gets loaded
+_LAZY_PROVIDERS = {
+    "GeminiProvider": ".gemini",
+    "ClaudeProvider": ".claude",
+    "OpenAIProvider": ".openai",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_PROVIDERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
+
+
+__all__ = ["AIProviderBase", "GeminiProvider", "ClaudeProvider", "OpenAIProvider"]
\ No newline at end of file
@@ -4,11 +4,55 @@ All provider implementations must inherit from this base class.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, Tuple, TypeVar
+import asyncio
 import logging
+import time
+
+import orjson
+
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, ValidationError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+async def semaphore_gather(
+    coros: Iterable[Awaitable[T]],
+    limit: int,
+    return_exceptions: bool = False
+) -> List[T]:
+    """
+    Await coroutines concurrently with at most `limit` running at once.
+    
+    Args:
+        coros: Coroutines to run
+        limit: Maximum number running concurrently
+        return_exceptions: Return exceptions as results instead of raising the first
+        
+    Returns:
+        Results in the same order as `coros`
+    """
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(coro: Awaitable[T]) -> T:
+        async with semaphore:
+            return await coro
+    
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=return_exceptions)
+
+
+class ProviderConfig(BaseModel):
+    """Validated configuration shared by all AI providers."""
+    model_config = ConfigDict(frozen=True)
+    
+    api_key: SecretStr = Field(..., min_length=1, description="API key for the provider")
+    model: str = Field(..., min_length=1, description="Model identifier")
+    temperature: float = Field(default=0.2, ge=0.0, le=1.0, description="Sampling temperature")
+    max_tokens: int = Field(default=4000, gt=0, description="Maximum tokens in response")
+    max_parallel_requests: int = Field(default=8, gt=0, description="Maximum concurrent calls to the provider API")
+
 
 class AIProviderBase(ABC):
     """
@@ -16,12 +60,16 @@ class AIProviderBase(ABC):
     Implements the Strategy pattern for vendor-agnostic AI operations.
     """
     
+    # Default seconds a successful health check result is reused
+    HEALTH_CHECK_TTL = 30.0
+    
     def __init__(
         self,
         api_key: str,
         model: str,
         temperature: float = 0.2,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        max_parallel_requests: int = 8
     ):
         """
         Initialize AI provider.
@@ -31,23 +79,34 @@ class AIProviderBase(ABC):
             model: Model identifier
             temperature: Sampling temperature (0.0-1.0)
             max_tokens: Maximum tokens in response
+            max_parallel_requests: Maximum concurrent calls to the provider API
+            
+        Raises:
+            ValueError: If the configuration is invalid
         """
-        self.api_key = api_key
-        self.model = model
-        self.temperature = temperature
-        self.max_tokens = max_tokens
-        self._validate_config()
-    
-    def _validate_config(self) -> None:
-        """Validate provider configuration."""
-        if not self.api_key:
-            raise ValueError(f"{self.__class__.__name__}: API key is required")
-        if not self.model:
-            raise ValueError(f"{self.__class__.__name__}: Model name is required")
-        if not 0.0 <= self.temperature <= 1.0:
-            raise ValueError(f"{self.__class__.__name__}: Temperature must be between 0.0 and 1.0")
-        if self.max_tokens <= 0:
-            raise ValueError(f"{self.__class__.__name__}: max_tokens must be positive")
+        try:
+            self.config = ProviderConfig(
+                api_key=api_key,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                max_parallel_requests=max_parallel_requests
+            )
+        except ValidationError as e:
+            raise ValueError(f"{self.__class__.__name__}: invalid configuration: {e}") from e
+        
+        self.api_key = self.config.api_key.get_secret_value()
+        self.model = self.config.model
+        self.temperature = self.config.temperature
+        self.max_tokens = self.config.max_tokens
+        
+        # Caps in-flight API calls so bursts queue here instead of tripping rate limits
+        self._request_semaphore = asyncio.Semaphore(self.config.max_parallel_requests)
+        
+        # Per-instance so tests can set it to 0 to disable health caching
+        self.health_check_ttl = self.HEALTH_CHECK_TTL
+        self._last_health: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._health_lock = asyncio.Lock()
     
     @abstractmethod
     async def generate_completion(
@@ -72,6 +131,71 @@ class AIProviderBase(ABC):
         """
         pass
     
+    async def stream_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Stream completion text as it is generated.
+        Providers without native streaming yield the whole completion at once.
+        
+        Args:
+            system_prompt: System instruction/persona
+            user_prompt: User's input prompt
+            json_mode: Whether to enforce JSON output
+            
+        Yields:
+            Text deltas in generation order
+            
+        Raises:
+            AIProviderError: If the API call fails
+        """
+        yield await self.generate_completion(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            json_mode=json_mode
+        )
+    
+    async def generate_json(self, system_prompt: str, user_prompt: str) -> Dict[str, Any]:
+        """
+        Generate a JSON-mode completion and parse it.
+        This is the single place provider output is parsed as JSON.
+        
+        Args:
+            system_prompt: System instruction/persona
+            user_prompt: User's input prompt
+            
+        Returns:
+            Parsed JSON object
+            
+        Raises:
+            AIProviderInvalidResponseError: If the response is not a JSON object
+            AIProviderError: If the API call fails
+        """
+        raw_response = await self.generate_completion(
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            json_mode=True
+        )
+        provider = self.get_provider_name()
+        try:
+            data = orjson.loads(raw_response)
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON from %s: %s", provider, raw_response[:200])
+            raise AIProviderInvalidResponseError(
+                f"{provider} returned invalid JSON: {e}",
+                provider=provider,
+                original_error=e
+            )
+        if not isinstance(data, dict):
+            raise AIProviderInvalidResponseError(
+                f"{provider} returned a JSON {type(data).__name__}, expected an object",
+                provider=provider
+            )
+        return data
+    
     @abstractmethod
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -90,6 +214,55 @@ class AIProviderBase(ABC):
         """
         pass
     
+    async def get_health(self, force: bool = False) -> Dict[str, Any]:
+        """
+        Get provider health, reusing a recent successful result.
+        
+        Health probes call the provider API, so a successful result is
+        cached for health_check_ttl seconds. Concurrent callers share a
+        single in-flight check.
+        
+        Args:
+            force: Bypass the cache and always query the provider
+            
+        Returns:
+            Dictionary with health status information
+        """
+        if not force and self._health_is_fresh():
+            return self._last_health[1]
+        
+        async with self._health_lock:
+            if not force and self._health_is_fresh():
+                return self._last_health[1]
+            
+            health = await self.health_check()
+            if health.get("status") in ("healthy", "connected"):
+                self._last_health = (time.monotonic(), health)
+            else:
+                self._last_health = None
+            return health
+    
+    def _health_is_fresh(self) -> bool:
+        """Check whether the cached health result is within its TTL."""
+        return (
+            self._last_health is not None
+            and time.monotonic() - self._last_health[0] < self.health_check_ttl
+        )
+    
+    async def warmup(self) -> None:
+        """
+        Open the provider's HTTP connection ahead of the first request.
+        Called once on application startup; no-op by default.
+        """
+        pass
+    
+    async def aclose(self) -> None:
+        """
+        Release network resources held by the provider.
+        Called once on application shutdown; no-op by default.
+        """
+        pass
+    
     def get_provider_name(self) -> str:
         """Get the name of this provider."""
         return self.__class__.__name__.replace("Provider", "").lower()
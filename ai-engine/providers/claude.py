@@ -2,11 +2,10 @@
 Anthropic Claude AI Provider Implementation.
 """
 
-import json
 import time
 import logging
-from typing import Dict, Any
-from anthropic import AsyncAnthropic
+from typing import Dict, Any, Optional
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient, Timeout
 from anthropic import APIError, RateLimitError, AuthenticationError
 
 from providers.base import (
@@ -20,6 +19,18 @@ from providers.base import (
 
 logger = logging.getLogger(__name__)
 
+# Connection pool shared by all Claude provider instances
+_HTTP_TIMEOUT = Timeout(60.0, connect=5.0)
+_http_client: Optional[DefaultAsyncHttpxClient] = None
+
+
+def _get_http_client() -> DefaultAsyncHttpxClient:
+    """Get or create the shared HTTP client for api.anthropic.com."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = DefaultAsyncHttpxClient(timeout=_HTTP_TIMEOUT)
+    return _http_client
+
 
 class ClaudeProvider(AIProviderBase):
     """Anthropic Claude provider implementation."""
@@ -29,7 +40,8 @@ class ClaudeProvider(AIProviderBase):
         api_key: str,
         model: str = "claude-3-sonnet-20240229",
         temperature: float = 0.2,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        max_parallel_requests: int = 8
     ):
         """
         Initialize Claude provider.
@@ -39,12 +51,13 @@ class ClaudeProvider(AIProviderBase):
             model: Claude model name
             temperature: Sampling temperature
             max_tokens: Maximum output tokens
+            max_parallel_requests: Maximum concurrent API calls
         """
-        super().__init__(api_key, model, temperature, max_tokens)
+        super().__init__(api_key, model, temperature, max_tokens, max_parallel_requests)
         
-        self.client = AsyncAnthropic(api_key=self.api_key)
+        self.client = AsyncAnthropic(api_key=self.api_key, http_client=_get_http_client())
         
-        logger.info(f"Claude provider initialized with model: {self.model}")
+        logger.info("Claude provider initialized with model: %s", self.model)
     
     async def generate_completion(
         self,
@@ -68,21 +81,25 @@ class ClaudeProvider(AIProviderBase):
         """
         try:
             # Claude uses system parameter separately
-            logger.info(f"Sending request to Claude ({self.model})")
-            start_time = time.time()
+            logger.info("Sending request to Claude (%s)", self.model)
+            start_ns = time.perf_counter_ns()
             
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
+            async with self._request_semaphore:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
+                    system=system_prompt,
+                    messages=[
+                        {"role": "user", "content": user_prompt}
+                    ]
+                )
             
-            latency = (time.time() - start_time) * 1000
-            logger.info(f"Claude response received in {latency:.2f}ms")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Claude response received in %.2fms",
+                    (time.perf_counter_ns() - start_ns) / 1e6
+                )
             
             # Extract content
             if not response.content or len(response.content) == 0:
@@ -99,15 +116,12 @@ class ClaudeProvider(AIProviderBase):
                     provider="claude"
                 )
             
-            # Validate JSON
-            try:
-                json.loads(content)
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON from Claude: {content[:200]}")
+            # Cheap structural check only; the service layer does the single full parse
+            if json_mode and content.lstrip()[:1] not in ("{", "["):
+                logger.error("Invalid JSON from Claude: %s", content[:200])
                 raise AIProviderInvalidResponseError(
-                    f"Claude returned invalid JSON: {str(e)}",
-                    provider="claude",
-                    original_error=e
+                    "Claude returned non-JSON content",
+                    provider="claude"
                 )
             
             return content
@@ -140,13 +154,24 @@ class ClaudeProvider(AIProviderBase):
             )
         
         except Exception as e:
-            logger.error(f"Unexpected Claude error: {str(e)}")
+            logger.error("Unexpected Claude error: %s", e)
             raise AIProviderError(
                 f"Unexpected error: {str(e)}",
                 provider="claude",
                 original_error=e
             )
     
+    async def warmup(self) -> None:
+        """Open a pooled connection with a model listing call, which costs no tokens."""
+        await self.client.models.list(limit=1)
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        global _http_client
+        if _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+    
     async def health_check(self) -> Dict[str, Any]:
         """
         Check Claude API health.
@@ -155,7 +180,7 @@ class ClaudeProvider(AIProviderBase):
             Health status information
         """
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Simple test generation
             response = await self.client.messages.create(
@@ -166,7 +191,7 @@ class ClaudeProvider(AIProviderBase):
                 ]
             )
             
-            latency = (time.time() - start_time) * 1000
+            latency = (time.perf_counter_ns() - start_ns) / 1e6
             
             if response.content and len(response.content) > 0:
                 return {
@@ -184,7 +209,7 @@ class ClaudeProvider(AIProviderBase):
                 }
                 
         except Exception as e:
-            logger.error(f"Claude health check failed: {str(e)}")
+            logger.error("Claude health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "provider": "claude",
@@ -2,12 +2,15 @@
 OpenAI AI Provider Implementation.
 """
 
-import json
 import time
+import asyncio
 import logging
-from typing import Dict, Any
-from openai import AsyncOpenAI
-from openai import OpenAIError, APIError, RateLimitError, AuthenticationError
+import httpx
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, Timeout
+from openai import OpenAIError, APIError, APIConnectionError, APIStatusError, APITimeoutError, RateLimitError, AuthenticationError
+from tenacity import retry, retry_if_exception, stop_after_attempt, stop_before_delay, wait_exponential_jitter
 
 from providers.base import (
     AIProviderBase,
@@ -20,6 +23,90 @@ from providers.base import (
 
 logger = logging.getLogger(__name__)
 
+# Model name prefixes that accept response_format={"type": "json_object"} (gpt-4 covers gpt-4o),
+# minus the early reasoning models that reject it
+_JSON_MODE_MODEL_PREFIXES = ("gpt-4", "gpt-3.5", "o1", "o3")
+_NO_JSON_MODE_MODEL_PREFIXES = ("o1-mini", "o1-preview")
+
+
+def _supports_json_mode(model: str) -> bool:
+    """Whether a model (including fine-tunes, named "ft:<base>:...") accepts JSON mode."""
+    base = model.removeprefix("ft:")
+    return base.startswith(_JSON_MODE_MODEL_PREFIXES) and not base.startswith(_NO_JSON_MODE_MODEL_PREFIXES)
+
+_HTTP_TIMEOUT = Timeout(60.0, connect=10.0)
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+
+@lru_cache(maxsize=8)
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    Get or create the AsyncOpenAI client for an API key.
+    Provider instances sharing a key share one connection pool.
+    """
+    # Retries are handled by OpenAIProvider._create, so the SDK's own retry loop is disabled
+    return AsyncOpenAI(
+        api_key=api_key,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+    )
+
+
+def _prompt_token_usage(response) -> Tuple[Optional[int], int]:
+    """
+    Extract (prompt tokens, cached prompt tokens) from a completion.
+    A non-zero cached count means OpenAI's automatic prefix cache matched the
+    static system prompt and preamble, which are billed at the cached rate.
+    """
+    usage = getattr(response, "usage", None)
+    if usage is None:
+        return None, 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    return usage.prompt_tokens, getattr(details, "cached_tokens", None) or 0
+
+
+# Longest server-requested Retry-After we are willing to sleep for
+_MAX_RETRY_AFTER = 60.0
+
+# Overall budget for a call and its retries, kept under backend-core's 60s AI_ENGINE_TIMEOUT;
+# a retry whose backoff would cross it is not attempted
+_RETRY_DEADLINE = 45.0
+_backoff = wait_exponential_jitter(initial=0.5, max=16)
+
+# Marks the end of an upstream stream in OpenAIProvider.stream_completion's buffer
+_STREAM_END = object()
+
+# SDK-level retries for calls that bypass OpenAIProvider._create (warmup, health checks)
+_SDK_MAX_RETRIES = 2
+
+# Non-5xx statuses the SDK itself treats as transient: request timeout and lock conflict
+_RETRYABLE_STATUS_CODES = frozenset({408, 409})
+
+
+def _is_retryable(e: BaseException) -> bool:
+    """
+    Match the errors the OpenAI SDK would retry: rate limits, connection failures, 408/409 and 5xx.
+    Timeouts are excluded, since a timed-out attempt has already used most of the deadline.
+    """
+    if isinstance(e, APITimeoutError):
+        return False
+    if isinstance(e, (RateLimitError, APIConnectionError)):
+        return True
+    if isinstance(e, APIStatusError):
+        return e.status_code >= 500 or e.status_code in _RETRYABLE_STATUS_CODES
+    return False
+
+
+def _retry_wait(retry_state) -> float:
+    """Honour the server's Retry-After header, else back off exponentially with jitter."""
+    response = getattr(retry_state.outcome.exception(), "response", None)
+    if response is not None:
+        try:
+            return min(float(response.headers.get("retry-after")), _MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            pass
+    return _backoff(retry_state)
+
 
 class OpenAIProvider(AIProviderBase):
     """OpenAI provider implementation."""
@@ -29,7 +116,8 @@ class OpenAIProvider(AIProviderBase):
         api_key: str,
         model: str = "gpt-4-turbo-preview",
         temperature: float = 0.2,
-        max_tokens: int = 4000
+        max_tokens: int = 4000,
+        max_parallel_requests: int = 8
     ):
         """
         Initialize OpenAI provider.
@@ -39,12 +127,16 @@ class OpenAIProvider(AIProviderBase):
             model: OpenAI model name
             temperature: Sampling temperature
             max_tokens: Maximum output tokens
+            max_parallel_requests: Maximum concurrent API calls
         """
-        super().__init__(api_key, model, temperature, max_tokens)
+        super().__init__(api_key, model, temperature, max_tokens, max_parallel_requests)
         
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = _get_openai_client(self.api_key)
+        # Shares the pooled connection but keeps the SDK's retries for calls made outside _create
+        self._sdk_retrying_client = self.client.with_options(max_retries=_SDK_MAX_RETRIES)
+        self._supports_json_mode = _supports_json_mode(self.model)
         
-        logger.info(f"OpenAI provider initialized with model: {self.model}")
+        logger.info("OpenAI provider initialized with model: %s", self.model)
     
     async def generate_completion(
         self,
@@ -67,30 +159,19 @@ class OpenAIProvider(AIProviderBase):
             AIProviderError: On API errors
         """
         try:
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-            
-            # Configure response format
-            kwargs = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": self.temperature,
-                "max_tokens": self.max_tokens
-            }
+            kwargs = self._build_request(system_prompt, user_prompt, json_mode)
             
-            # Enable JSON mode for GPT-4 and newer models
-            if json_mode and ("gpt-4" in self.model or "gpt-3.5" in self.model):
-                kwargs["response_format"] = {"type": "json_object"}
+            logger.info("Sending request to OpenAI (%s)", self.model)
+            start_ns = time.perf_counter_ns()
             
-            logger.info(f"Sending request to OpenAI ({self.model})")
-            start_time = time.time()
+            response = await self._create(**kwargs)
             
-            response = await self.client.chat.completions.create(**kwargs)
-            
-            latency = (time.time() - start_time) * 1000
-            logger.info(f"OpenAI response received in {latency:.2f}ms")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "OpenAI response received in %.2fms (prompt tokens: %s, cached: %s)",
+                    (time.perf_counter_ns() - start_ns) / 1e6,
+                    *_prompt_token_usage(response)
+                )
             
             # Extract content
             content = response.choices[0].message.content
@@ -101,61 +182,152 @@ class OpenAIProvider(AIProviderBase):
                     provider="openai"
                 )
             
-            # Validate JSON
-            try:
-                json.loads(content)
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON from OpenAI: {content[:200]}")
-                raise AIProviderInvalidResponseError(
-                    f"OpenAI returned invalid JSON: {str(e)}",
-                    provider="openai",
-                    original_error=e
-                )
-            
             return content
             
-        except AuthenticationError as e:
-            raise AIProviderAuthError(
+        except Exception as e:
+            raise self._map_error(e)
+    
+    async def stream_completion(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        json_mode: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Stream completion text from OpenAI as it is generated.
+        Streamed calls are not retried, since part of the output may already be consumed.
+        
+        The upstream stream is drained into a buffer by a background task, so the
+        request slot is released when OpenAI finishes, not when a slow consumer does.
+        
+        Args:
+            system_prompt: System message
+            user_prompt: User's prompt
+            json_mode: Enable JSON mode
+            
+        Yields:
+            Text deltas in generation order
+            
+        Raises:
+            AIProviderError: On API errors
+        """
+        kwargs = self._build_request(system_prompt, user_prompt, json_mode)
+        kwargs["stream"] = True
+        buffer: asyncio.Queue = asyncio.Queue()
+        
+        async def drain() -> None:
+            try:
+                async with self._request_semaphore:
+                    stream = await self.client.chat.completions.create(**kwargs)
+                    async for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            buffer.put_nowait(chunk.choices[0].delta.content)
+            except Exception as e:
+                buffer.put_nowait(self._map_error(e))
+            finally:
+                buffer.put_nowait(_STREAM_END)
+        
+        drain_task = asyncio.create_task(drain())
+        try:
+            while True:
+                item = await buffer.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, AIProviderError):
+                    raise item
+                yield item
+        finally:
+            # Stop the upstream read if the consumer goes away early
+            drain_task.cancel()
+    
+    def _build_request(self, system_prompt: str, user_prompt: str, json_mode: bool) -> Dict[str, Any]:
+        """Build the chat completion arguments for a prompt pair."""
+        # The static system prompt must stay first so repeated calls share a cacheable prefix
+        kwargs = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens
+        }
+        
+        # Enable JSON mode for models that support it
+        if json_mode and self._supports_json_mode:
+            kwargs["response_format"] = {"type": "json_object"}
+        
+        return kwargs
+    
+    def _map_error(self, e: Exception) -> AIProviderError:
+        """Translate an OpenAI SDK exception into the matching AIProviderError."""
+        if isinstance(e, AIProviderError):
+            return e
+        
+        if isinstance(e, AuthenticationError):
+            return AIProviderAuthError(
                 "Invalid or missing OpenAI API key",
                 provider="openai",
                 original_error=e
             )
         
-        except RateLimitError as e:
-            raise AIProviderRateLimitError(
+        if isinstance(e, RateLimitError):
+            return AIProviderRateLimitError(
                 "OpenAI API rate limit exceeded",
                 provider="openai",
                 original_error=e
             )
         
-        except APIError as e:
+        if isinstance(e, APIError):
             if "connection" in str(e).lower():
-                raise AIProviderConnectionError(
+                return AIProviderConnectionError(
                     f"Failed to connect to OpenAI: {str(e)}",
                     provider="openai",
                     original_error=e
                 )
-            raise AIProviderError(
+            return AIProviderError(
                 f"OpenAI API error: {str(e)}",
                 provider="openai",
                 original_error=e
             )
         
-        except OpenAIError as e:
-            logger.error(f"OpenAI error: {str(e)}")
-            raise AIProviderError(
+        if isinstance(e, OpenAIError):
+            logger.error("OpenAI error: %s", e)
+            return AIProviderError(
                 f"OpenAI error: {str(e)}",
                 provider="openai",
                 original_error=e
             )
         
-        except Exception as e:
-            logger.error(f"Unexpected OpenAI error: {str(e)}")
-            raise AIProviderError(
-                f"Unexpected error: {str(e)}",
-                provider="openai",
-                original_error=e
-            )
+        logger.error("Unexpected OpenAI error: %s", e)
+        return AIProviderError(
+            f"Unexpected error: {str(e)}",
+            provider="openai",
+            original_error=e
+        )
+    
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        wait=_retry_wait,
+        stop=stop_after_attempt(7) | stop_before_delay(_RETRY_DEADLINE),
+        reraise=True
+    )
+    async def _create(self, **kwargs):
+        """
+        Create a chat completion, retrying rate limits, connection failures and transient server errors.
+        A request slot is held per attempt only, so backoff sleeps don't block other requests.
+        """
+        async with self._request_semaphore:
+            return await self.client.chat.completions.create(**kwargs)
+    
+    async def aclose(self) -> None:
+        """Close the shared client's connection pool."""
+        await self.client.close()
+        _get_openai_client.cache_clear()
+    
+    async def warmup(self) -> None:
+        """Open a pooled connection with a model lookup, which costs no tokens."""
+        await self._sdk_retrying_client.models.retrieve(self.model)
     
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -165,10 +337,10 @@ class OpenAIProvider(AIProviderBase):
             Health status information
         """
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Simple test generation
-            response = await self.client.chat.completions.create(
+            response = await self._sdk_retrying_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "user", "content": "Return only this JSON: {\"status\": \"ok\"}"}
@@ -176,7 +348,7 @@ class OpenAIProvider(AIProviderBase):
                 max_tokens=50
             )
             
-            latency = (time.time() - start_time) * 1000
+            latency = (time.perf_counter_ns() - start_ns) / 1e6
             
             if response.choices[0].message.content:
                 return {
@@ -194,7 +366,7 @@ class OpenAIProvider(AIProviderBase):
                 }
                 
         except Exception as e:
-            logger.error(f"OpenAI health check failed: {str(e)}")
+            logger.error("OpenAI health check failed: %s", e)
             return {
                 "status": "unhealthy",
                 "provider": "openai",
@@ -3,8 +3,9 @@ Pydantic models for request/response validation.
 All API endpoints must use these schemas for strict type checking.
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, List, Optional, Dict, Any
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 from enum import Enum
 
 
@@ -45,32 +46,30 @@ class SuggestionPriority(str, Enum):
 # Request Models
 class ResumeAnalysisRequest(BaseModel):
     """Request schema for resume analysis."""
-    resume_text: str = Field(..., min_length=100, max_length=50000, description="Raw text extracted from resume")
-    target_role: str = Field(..., min_length=2, max_length=200, description="Target job role (e.g., 'Senior Software Engineer')")
-    
-    @validator('resume_text')
-    def validate_resume_text(cls, v: str) -> str:
-        """Ensure resume text is not empty or whitespace only."""
-        if not v.strip():
-            raise ValueError("Resume text cannot be empty")
-        return v.strip()
-    
-    @validator('target_role')
-    def validate_target_role(cls, v: str) -> str:
-        """Ensure target role is properly formatted."""
-        return v.strip()
-
-    class Config:
-        json_schema_extra = {
+    # Whitespace is stripped before the length bounds are checked
+    resume_text: Annotated[str, StringConstraints(min_length=100, max_length=50000)] = Field(..., description="Raw text extracted from resume")
+    target_role: Annotated[str, StringConstraints(min_length=2, max_length=200)] = Field(..., description="Target job role (e.g., 'Senior Software Engineer')")
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        str_strip_whitespace=True,
+        json_schema_extra={
             "example": {
                 "resume_text": "John Doe\nSoftware Engineer\n\nExperience:\n- Developed REST APIs using Python and FastAPI\n- Built microservices architecture...",
                 "target_role": "Senior Backend Engineer"
             }
         }
+    )
 
 
 # Response Models
-class ATSScoreBreakdown(BaseModel):
+class _ResponseModel(BaseModel):
+    """Base for response models built from AI output: immutable, tolerant of extra keys."""
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False, populate_by_name=True)
+
+
+class ATSScoreBreakdown(_ResponseModel):
     """Detailed breakdown of ATS score components."""
     formatting: int = Field(..., ge=0, le=100, description="Score for resume formatting (0-100)")
     keywords: int = Field(..., ge=0, le=100, description="Score for keyword optimization (0-100)")
@@ -79,13 +78,13 @@ class ATSScoreBreakdown(BaseModel):
     skills: int = Field(..., ge=0, le=100, description="Score for skills section (0-100)")
 
 
-class ATSScore(BaseModel):
+class ATSScore(_ResponseModel):
     """ATS score with detailed breakdown."""
     overall: int = Field(..., ge=0, le=100, description="Overall ATS compatibility score (0-100)")
     breakdown: ATSScoreBreakdown
 
 
-class SkillToImprove(BaseModel):
+class SkillToImprove(_ResponseModel):
     """Skill that needs improvement."""
     skill: str = Field(..., description="Name of the skill")
     current_level: SkillProficiency = Field(..., description="Current proficiency level")
@@ -93,7 +92,7 @@ class SkillToImprove(BaseModel):
     priority: SkillPriority = Field(..., description="Priority for learning this skill")
 
 
-class SkillGapAnalysis(BaseModel):
+class SkillGapAnalysis(_ResponseModel):
     """Analysis of skill gaps for target role."""
     current_skills: List[str] = Field(..., description="Skills found in the resume")
     required_skills: List[str] = Field(..., description="Skills required for target role")
@@ -101,7 +100,7 @@ class SkillGapAnalysis(BaseModel):
     skills_to_improve: List[SkillToImprove] = Field(..., description="Skills that need improvement")
 
 
-class ResumeSuggestion(BaseModel):
+class ResumeSuggestion(_ResponseModel):
     """Actionable suggestion for resume improvement."""
     category: SuggestionCategory = Field(..., description="Category of the suggestion")
     priority: SuggestionPriority = Field(..., description="Priority level")
@@ -111,16 +110,16 @@ class ResumeSuggestion(BaseModel):
     example_after: str = Field(..., description="Example of improved format")
 
 
-class ResumeAnalysisResponse(BaseModel):
+class ResumeAnalysisResponse(_ResponseModel):
     """Complete response for resume analysis."""
     ats_score: ATSScore
     skill_gap_analysis: SkillGapAnalysis
-    suggestions: List[ResumeSuggestion] = Field(..., min_items=1)
+    suggestions: List[ResumeSuggestion] = Field(..., min_length=1)
     analyzed_at: str = Field(..., description="ISO 8601 timestamp of analysis")
     model_version: str = Field(..., description="AI model version used")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "ats_score": {
                     "overall": 78,
@@ -159,6 +158,11 @@ class ResumeAnalysisResponse(BaseModel):
                 "model_version": "models/gemini-2.5-flash"
             }
         }
+    )
+
+    def to_orjson_bytes(self) -> bytes:
+        """Serialize to JSON bytes with orjson, ready to send as a response body."""
+        return orjson.dumps(self.model_dump(mode="json"))
 
 
 # Health Check Models
@@ -169,7 +173,7 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
-class HealthCheckResponse(BaseModel):
+class HealthCheckResponse(_ResponseModel):
     """Health check response."""
     status: HealthStatus
     service: str
@@ -178,8 +182,8 @@ class HealthCheckResponse(BaseModel):
     ai_provider: str
     ai_provider_status: str
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "healthy",
                 "service": "ai-engine",
@@ -189,10 +193,13 @@ class HealthCheckResponse(BaseModel):
                 "ai_provider_status": "connected"
             }
         }
+    )
 
 class RoadmapRequest(BaseModel):
-    missing_skills: List[str]
-    target_role: str
+    model_config = ConfigDict(frozen=True, extra="forbid", str_strip_whitespace=True)
+
+    missing_skills: List[str] = Field(..., min_length=1, description="Skills the roadmap should cover")
+    target_role: str = Field(..., min_length=1, description="Target job role for the roadmap")
 
 class MilestoneTask(BaseModel):
     description: str
@@ -203,6 +210,8 @@ class Milestone(BaseModel):
     tasks: List[MilestoneTask]
 
 class RoadmapResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     milestones: List[Milestone]
 
 
@@ -295,14 +304,14 @@ class MentorIndexRequest(BaseModel):
 
 
 # Error Models
-class ErrorResponse(BaseModel):
+class ErrorResponse(_ResponseModel):
     """Standard error response."""
     error: str = Field(..., description="Error type")
     message: str = Field(..., description="Human-readable error message")
     detail: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "ValidationError",
                 "message": "Invalid resume text format",
@@ -311,4 +320,5 @@ class ErrorResponse(BaseModel):
                     "issue": "Text is too short"
                 }
             }
-        }
\ No newline at end of file
+        }
+    )
\ No newline at end of file
@@ -3,36 +3,61 @@ Service layer for AI operations.
 Contains business logic for resume analysis and other AI tasks.
 """
 
-import json
 import time
 import logging
 import asyncio
-from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any
 
-from providers.base import AIProviderBase, AIProviderError, AIProviderInvalidResponseError
+import orjson
+
+from providers.base import AIProviderBase, AIProviderError, AIProviderInvalidResponseError, semaphore_gather
 from core.prompts import PromptTemplates
-from schemas import ResumeAnalysisRequest, ResumeAnalysisResponse
-from pydantic import ValidationError
-from typing import List, Dict, Any, Optional
+from core.llm_cache import LLMCache
+from core.clock import utc_timestamp
+from schemas import ResumeAnalysisRequest, ResumeAnalysisResponse, RoadmapResponse
+from pydantic import TypeAdapter, ValidationError
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_resume_adapter = TypeAdapter(ResumeAnalysisResponse)
+_roadmap_adapter = TypeAdapter(RoadmapResponse)
+
+
+# Rendered prompts for recently seen inputs, so retried or duplicate requests
+# skip template assembly. Keys hold the full inputs, hence the small bound.
+@lru_cache(maxsize=128)
+def _render_resume_prompt(resume_text: str, target_role: str) -> str:
+    return PromptTemplates.get_resume_analysis_prompt(resume_text=resume_text, target_role=target_role)
+
+
+@lru_cache(maxsize=128)
+def _render_roadmap_prompt(missing_skills: Tuple[str, ...], target_role: str) -> str:
+    return PromptTemplates.get_roadmap_generation_prompt(missing_skills=missing_skills, target_role=target_role)
+
 
 class AIService:
     """Service class for AI operations."""
     
-    def __init__(self, provider: AIProviderBase):
+    def __init__(self, provider: AIProviderBase, cache: Optional[LLMCache] = None):
         """
         Initialize AI service with a provider.
         
         Args:
             provider: Configured AI provider instance
+            cache: Response cache; when omitted, built from settings only if the
+                provider samples deterministically (temperature 0)
         """
         self.provider = provider
         self.prompts = PromptTemplates()
+        if cache is None and provider.temperature == 0:
+            # At temperature > 0 resubmitting should yield a fresh analysis, so don't cache
+            cache = LLMCache.from_settings(get_settings())
+        self.cache = cache
        
-        logger.info(f"AIService initialized with provider: {self.provider.get_provider_name()}")
+        logger.info("AIService initialized with provider: %s", self.provider.get_provider_name())
     
     async def analyze_resume(
         self,
@@ -54,46 +79,51 @@ class AIService:
         try:
             # Generate prompts
             system_prompt = self.prompts.SYSTEM_PERSONA
-            user_prompt = self.prompts.get_resume_analysis_prompt(
+            user_prompt = _render_resume_prompt(request.resume_text, request.target_role)
+            logger.debug("Full user prompt (first 200 chars): %.200s", user_prompt)
+            logger.debug("Target role in prompt: %s", request.target_role)
+            
+            prompt_tokens = self.prompts.estimate_resume_analysis_tokens(
                 resume_text=request.resume_text,
                 target_role=request.target_role
             )
-            logger.info(f"DEBUG: FULL USER PROMPT (first 200 chars): {user_prompt[:200]}")
-            logger.info(f"DEBUG: TARGET ROLE IN PROMPT: {request.target_role}")
-            
             logger.info(
-                f"Analyzing resume for role: {request.target_role} "
-                f"(resume length: {len(request.resume_text)} chars)"
+                "Analyzing resume for role: %s (resume length: %d chars, ~%d prompt tokens)",
+                request.target_role, len(request.resume_text), prompt_tokens
             )
             
-            # Call AI provider
-            raw_response = await self.provider.generate_completion(
+            # Serve identical requests from the cache
+            cache_key = None
+            if self.cache is not None:
+                cache_key = LLMCache.make_key(
+                    self.provider.model, system_prompt, user_prompt, self.provider.temperature
+                )
+                cached = await self.cache.get(cache_key)
+                if cached is not None:
+                    logger.info("Resume analysis served from cache")
+                    # Stamp the hit as analyzed now; the stored copy keeps its original time
+                    return _resume_adapter.validate_python({**cached, "analyzed_at": utc_timestamp()})
+            
+            # Call AI provider; the response is parsed once, by the provider
+            response_data = await self.provider.generate_json(
                 system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                json_mode=True
+                user_prompt=user_prompt
             )
             
-            # Parse JSON response
-            try:
-                response_data = json.loads(raw_response)
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse AI response as JSON: {raw_response[:200]}")
-                raise AIProviderInvalidResponseError(
-                    message="AI provider returned invalid JSON",
-                    provider=self.provider.get_provider_name(),
-                    original_error=e
-                )
-            
             # Add metadata
-            response_data["analyzed_at"] = datetime.now(timezone.utc).isoformat()
+            response_data["analyzed_at"] = utc_timestamp()
             response_data["model_version"] = self.provider.model
             
             # Validate response against Pydantic schema
             try:
-                validated_response = ResumeAnalysisResponse(**response_data)
+                validated_response = _resume_adapter.validate_python(response_data)
             except ValidationError as e:
-                logger.error(f"AI response validation failed: {str(e)}")
-                logger.error(f"Response data: {json.dumps(response_data, indent=2)}")
+                logger.error("AI response validation failed: %s", e)
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(
+                        "Response data (truncated): %s",
+                        orjson.dumps(response_data)[:2000].decode("utf-8", "replace")
+                    )
                 raise AIProviderInvalidResponseError(
                     message=f"AI response failed validation: {str(e)}",
                     provider=self.provider.get_provider_name(),
@@ -101,75 +131,204 @@ class AIService:
                 )
             
             logger.info(
-                f"Resume analysis completed successfully. "
-                f"ATS Score: {validated_response.ats_score.overall}/100"
+                "Resume analysis completed successfully. ATS Score: %d/100",
+                validated_response.ats_score.overall
             )
             
+            if cache_key is not None:
+                await self.cache.set(cache_key, validated_response.model_dump(mode="json"))
+            
             return validated_response
             
         except AIProviderError:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error during resume analysis: {str(e)}")
+            logger.error("Unexpected error during resume analysis: %s", e)
             raise AIProviderError(
                 message=f"Resume analysis failed: {str(e)}",
                 provider=self.provider.get_provider_name(),
                 original_error=e
             )
+
+    async def analyze_resume_bytes(self, request: ResumeAnalysisRequest) -> bytes:
+        """
+        Analyze a resume and return the response pre-serialized as JSON.
+        
+        Lets routes send the body as-is instead of re-encoding the model.
+        
+        Args:
+            request: Resume analysis request with resume text and target role
+            
+        Returns:
+            JSON-encoded ResumeAnalysisResponse
+            
+        Raises:
+            AIProviderError: If AI provider call fails
+        """
+        result = await self.analyze_resume(request)
+        return result.to_orjson_bytes()
+
+    async def analyze_resumes_batch(
+        self,
+        requests: List[ResumeAnalysisRequest]
+    ) -> List[Union[ResumeAnalysisResponse, AIProviderError]]:
+        """
+        Analyze many resumes concurrently, e.g. for bulk ingestion.
+        
+        Each resume is analyzed independently (and can hit the response cache),
+        with at most the provider's max_parallel_requests in flight.
+        
+        Args:
+            requests: Resume analysis requests
+            
+        Returns:
+            One entry per request, in order: the analysis, or the AIProviderError
+            that request failed with
+        """
+        return await semaphore_gather(
+            (self.analyze_resume(request) for request in requests),
+            limit=self.provider.config.max_parallel_requests,
+            return_exceptions=True
+        )
+    
+    async def analyze_resume_stream(self, request: ResumeAnalysisRequest) -> AsyncIterator[str]:
+        """
+        Stream the raw JSON of a resume analysis as the provider generates it.
+        
+        Unlike analyze_resume, the output is neither cached nor validated, and
+        no metadata is added; consumers assemble and parse the JSON themselves.
+        
+        Args:
+            request: Resume analysis request with resume text and target role
+            
+        Yields:
+            JSON text deltas
+            
+        Raises:
+            AIProviderError: If AI provider call fails
+        """
+        user_prompt = _render_resume_prompt(request.resume_text, request.target_role)
+        async for delta in self.provider.stream_completion(
+            system_prompt=self.prompts.SYSTEM_PERSONA,
+            user_prompt=user_prompt,
+            json_mode=True
+        ):
+            yield delta
+    
         # ===== NEW: Generate Roadmap Method =====
 
     async def generate_roadmap(
         self,
         missing_skills: List[str],
         target_role: str
-    ) -> Dict[str, Any]:
+    ) -> RoadmapResponse:
         """
         Generate 8-week learning roadmap based on missing skills
+        
+        Raises:
+            AIProviderInvalidResponseError: If the roadmap JSON has the wrong structure
+            AIProviderError: If AI provider call fails
         """
         try:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
-            logger.info(f"Generating roadmap for {target_role} with {len(missing_skills)} missing skills")
+            logger.info("Generating roadmap for %s with %d missing skills", target_role, len(missing_skills))
             
             # 1. Get prompts
             system_prompt = self.prompts.ROADMAP_SYSTEM_PROMPT
-            user_prompt = self.prompts.get_roadmap_generation_prompt(
-                missing_skills=missing_skills,
-                target_role=target_role
-            )
+            user_prompt = _render_roadmap_prompt(tuple(missing_skills), target_role)
             
             # 2. Call AI provider abstraction (Sahi Tareeka)
-            raw_response = await self.provider.generate_completion(
+            roadmap_data = await self.provider.generate_json(
                 system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                json_mode=True
+                user_prompt=user_prompt
             )
             
-            latency = (time.time() - start_time) * 1000
-            logger.info(f"Roadmap generated in {latency:.2f}ms")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Roadmap generated in %.2fms", (time.perf_counter_ns() - start_ns) / 1e6)
             
-            # 3. Parse JSON response
-            roadmap_data = json.loads(raw_response)
+            # 3. Validate structure into a typed roadmap
+            try:
+                return _roadmap_adapter.validate_python(roadmap_data)
+            except ValidationError as e:
+                logger.error("Roadmap validation failed: %s", e)
+                raise AIProviderInvalidResponseError(
+                    message=f"Roadmap failed validation: {str(e)}",
+                    provider=self.provider.get_provider_name(),
+                    original_error=e
+                )
             
-            # 4. Basic validation
-            if "milestones" not in roadmap_data:
-                raise Exception("Invalid roadmap structure - missing milestones")
+        except AIProviderError:
+            raise
+        except Exception as e:
+            logger.error("Roadmap generation failed: %s", e)
+            raise AIProviderError(
+                message=f"Failed to generate roadmap: {str(e)}",
+                provider=self.provider.get_provider_name(),
+                original_error=e
+            )
+    
+    async def analyze_and_plan(
+        self,
+        request: ResumeAnalysisRequest,
+        prefetch_roadmap_skills: Optional[List[str]] = None
+    ) -> Tuple[ResumeAnalysisResponse, Optional[RoadmapResponse]]:
+        """
+        Analyze a resume and generate a roadmap for it in one call.
+        
+        When the skills to plan for are known up front, both LLM calls run
+        concurrently; otherwise the roadmap is built from the analysis'
+        missing skills once it completes.
+        
+        Args:
+            request: Resume analysis request with resume text and target role
+            prefetch_roadmap_skills: Skills to plan for without waiting on the analysis
             
-            return roadmap_data
+        Returns:
+            Tuple of (analysis, roadmap); roadmap is None if there were no missing
+            skills or its generation failed
             
-        except Exception as e:
-            logger.error(f"Roadmap generation failed: {str(e)}")
-            raise Exception(f"Failed to generate roadmap: {str(e)}")
+        Raises:
+            AIProviderError: If the resume analysis fails
+        """
+        if prefetch_roadmap_skills:
+            analysis, roadmap = await asyncio.gather(
+                self.analyze_resume(request),
+                self.generate_roadmap(prefetch_roadmap_skills, request.target_role),
+                return_exceptions=True
+            )
+            if isinstance(analysis, BaseException):
+                raise analysis
+        else:
+            analysis = await self.analyze_resume(request)
+            missing_skills = analysis.skill_gap_analysis.missing_skills
+            if not missing_skills:
+                # Nothing to plan for; skip the LLM call
+                return analysis, None
+            try:
+                roadmap = await self.generate_roadmap(missing_skills, request.target_role)
+            except Exception as e:
+                roadmap = e
+        
+        # A failed roadmap should not discard a successful analysis
+        if isinstance(roadmap, BaseException):
+            logger.warning("Roadmap generation failed during analyze_and_plan: %s", roadmap)
+            roadmap = None
+        
+        return analysis, roadmap
     
-    async def health_check(self) -> Dict[str, Any]:
+    async def health_check(self, force: bool = False) -> Dict[str, Any]:
         """
         Check if the AI service and provider are healthy.
         
+        Args:
+            force: Bypass the provider's cached health result
+        
         Returns:
             Health check results
         """
         try:
-            provider_health = await self.provider.health_check()
+            provider_health = await self.provider.get_health(force=force)
             
             return {
     "service": "ai-service",
@@ -177,7 +336,7 @@ class AIService:
     "provider": provider_health
 }
         except Exception as e:
-            logger.error(f"Health check failed: {str(e)}")
+            logger.error("Health check failed: %s", e)
             return {
                 "service": "ai-service",
                 "status": "unhealthy",
@@ -197,5 +356,6 @@ class AIService:
         """
         return {
             "service": "ai-service",
-            "provider": self.provider.get_model_info()
+            "provider": self.provider.get_model_info(),
+            "cache": dict(self.cache.stats) if self.cache is not None else None
         }
\ No newline at end of file
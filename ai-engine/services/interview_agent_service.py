@@ -29,7 +29,7 @@ from schemas import (
     InterviewScorecard,
     QuestionEvaluation,
 )
-from config import settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,8 @@ class InterviewAgentService:
     MAX_QUESTIONS = 10
     
     def __init__(self):
+        settings = get_settings()
+        
         # Create LangChain chat model from our existing provider config
         self.llm = get_langchain_chat_model(
             provider=settings.ai_provider,
@@ -14,7 +14,7 @@ from schemas import (
     InterviewReport,
     InterviewScorecard
 )
-from config import settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +26,7 @@ class InterviewService:
     def __init__(self, provider: AIProviderBase):
         self.provider = provider
         self.prompts = PromptTemplates()
-        self.redis = redis.from_url(settings.redis_url, decode_responses=True)
+        self.redis = redis.from_url(get_settings().redis_url, decode_responses=True)
 
     async def _get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         data = await self.redis.get(f"interview:{session_id}")
@@ -47,13 +47,10 @@ class InterviewService:
             interview_type=request.interview_type.value
         )
         
-        raw_response = await self.provider.generate_completion(
+        response_data = await self.provider.generate_json(
             system_prompt=system_prompt,
-            user_prompt="[START] Introduce yourself and ask the first question.",
-            json_mode=True
+            user_prompt="[START] Introduce yourself and ask the first question."
         )
-        
-        response_data = json.loads(raw_response)
         initial_question = response_data.get("next_question", "Tell me about yourself.")
         
         session_data = {
@@ -84,13 +81,10 @@ class InterviewService:
         history_text = "\n".join([f"{m['role']}: {m['content']}" for m in history])
         user_prompt = f"Transcript:\n{history_text}\n\nAssistant: Respond in JSON."
 
-        raw_response = await self.provider.generate_completion(
+        response_data = await self.provider.generate_json(
             system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            json_mode=True
+            user_prompt=user_prompt
         )
-        
-        response_data = json.loads(raw_response)
         next_q = response_data.get("next_question", "...")
         is_ended = response_data.get("is_ended", False)
         
@@ -109,14 +103,11 @@ class InterviewService:
             transcript = "\n".join([f"{m['role']}: {m['content']}" for m in session_data["history"]])
             report_prompt = self.prompts.get_interview_report_prompt(session_data["target_role"], transcript)
             
-            raw_response = await self.provider.generate_completion(
+            scorecard_data = await self.provider.generate_json(
                 system_prompt="You are a hiring manager. Provide an interview scorecard in JSON.",
-                user_prompt=report_prompt,
-                json_mode=True
+                user_prompt=report_prompt
             )
             
-            scorecard_data = json.loads(raw_response)
-            
             # Normalize fields to handle LLM variations
             normalized_scorecard = {
                 "overall_score": scorecard_data.get("overall_score") or scorecard_data.get("score") or 70,
@@ -67,12 +67,10 @@ class MentorService:
         """
         
         try:
-            raw_evaluation = await self.provider.generate_completion(
+            evaluation_results = await self.provider.generate_json(
                 system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                json_mode=True
+                user_prompt=user_prompt
             )
-            evaluation_results = json.loads(raw_evaluation)
             
             metadata_map = {m['id']: m.get('metadata', {}) for m in pinecone_matches}
             
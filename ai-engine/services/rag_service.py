@@ -5,7 +5,7 @@ import os
 import asyncio
 
 from providers.base import AIProviderBase
-from config import settings
+from config import get_settings
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +14,7 @@ class RAGService:
     
     def __init__(self, provider: AIProviderBase):
         self.provider = provider
+        settings = get_settings()
         
         # Initialize Pinecone client
         if not settings.pinecone_api_key: